@@ -1,34 +1,99 @@
 from flask import Flask, request, jsonify, render_template
+from flask.json.provider import JSONProvider
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from flask_migrate import Migrate
-from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime
+from sqlalchemy import event, select, insert, and_, or_
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+from datetime import datetime, timezone
+from functools import wraps
 import os
+import queue
+import time
+import atexit
+import threading
+import orjson
 from dotenv import load_dotenv
+from cache import cache
 
 # Load environment variables
 load_dotenv()
 
+class OrjsonProvider(JSONProvider):
+    """Serialize responses with orjson, which also handles datetimes natively"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-here')
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///audit_logs.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+def sqlite_engine_options(uri):
+    """Engine options for file-backed SQLite: pool connections and share them across threads
+
+    WAL allows concurrent readers but only one writer, so run a single worker
+    process to avoid SQLITE_BUSY.
+    """
+    url = make_url(uri)
+    if url.get_backend_name() != 'sqlite' or url.database in (None, '', ':memory:'):
+        return {}
+    return {
+        'poolclass': QueuePool,
+        'pool_size': 10,
+        'max_overflow': 20,
+        'pool_pre_ping': True,
+        'connect_args': {'check_same_thread': False}
+    }
+
+# Audit logs live in their own database so audit writes don't take the main database's write lock
+audit_database_uri = os.getenv('AUDIT_DATABASE_URL', 'sqlite:///audit.db')
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = sqlite_engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
+app.config['SQLALCHEMY_BINDS'] = {
+    'audit': {'url': audit_database_uri, **sqlite_engine_options(audit_database_uri)}
+}
+
 db = SQLAlchemy(app)
 migrate = Migrate(app, db)
 login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = 'login'
 
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL so readers don't block on commits, and relax fsyncs to once per checkpoint"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA busy_timeout=5000')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA cache_size=-64000')
+    cursor.close()
+
+# Engines are created lazily, so register the pragmas inside an app context
+with app.app_context():
+    for engine in db.engines.values():
+        if engine.dialect.name == 'sqlite':
+            event.listen(engine, 'connect', set_sqlite_pragmas)
+
 # Models
 class Account(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     domain = db.Column(db.String(100), unique=True, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    users = db.relationship('User', backref='account', lazy=True)
-    audit_logs = db.relationship('AuditLog', backref='account', lazy=True)
+    # Collections raise instead of lazy loading; callers must choose a loader strategy explicitly
+    users = db.relationship('User', back_populates='account', lazy='raise_on_sql')
+    audit_logs = db.relationship('AuditLog', back_populates='account', lazy='raise_on_sql',
+                                 primaryjoin='Account.id == foreign(AuditLog.account_id)')
 
 class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -40,40 +105,252 @@ class User(UserMixin, db.Model):
     account_id = db.Column(db.Integer, db.ForeignKey('account.id'), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     is_active = db.Column(db.Boolean, default=True)
+    account = db.relationship('Account', back_populates='users')
+    audit_logs = db.relationship('AuditLog', back_populates='user', lazy='raise_on_sql',
+                                 primaryjoin='User.id == foreign(AuditLog.user_id)')
 
 class AuditLog(db.Model):
+    __bind_key__ = 'audit'
+    # No foreign keys: users and accounts are in the main database
+    # Matches the audit log listing: filter by account, newest first, keyset on (created_at, id)
+    __table_args__ = (db.Index('ix_audit_account_created', 'account_id', 'created_at', 'id'),)
+
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    account_id = db.Column(db.Integer, db.ForeignKey('account.id'), nullable=False)
-    action = db.Column(db.String(100), nullable=False)
-    resource_type = db.Column(db.String(50), nullable=False)
+    user_id = db.Column(db.Integer, nullable=False, index=True)
+    account_id = db.Column(db.Integer, nullable=False)
+    action = db.Column(db.String(100), nullable=False, index=True)
+    resource_type = db.Column(db.String(50), nullable=False, index=True)
     resource_id = db.Column(db.String(50))
     details = db.Column(db.Text)
     ip_address = db.Column(db.String(45))
     user_agent = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    user = db.relationship('User', backref='audit_logs')
+    account = db.relationship('Account', back_populates='audit_logs',
+                              primaryjoin='foreign(AuditLog.account_id) == Account.id')
+    user = db.relationship('User', back_populates='audit_logs',
+                           primaryjoin='foreign(AuditLog.user_id) == User.id')
+
+# Argon2id with explicit costs (~tens of ms per hash) instead of Werkzeug's pbkdf2 default.
+# One shared hasher; it is thread-safe and holds no per-call state.
+ph = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+
+def hash_password(password):
+    return ph.hash(password)
+
+def verify_password(password_hash, password):
+    """Check a password against an Argon2 hash, or a legacy Werkzeug hash"""
+    try:
+        return ph.verify(password_hash, password)
+    except VerificationError:
+        return False
+    except InvalidHashError:
+        return check_password_hash(password_hash, password)
+
+# Verified against on unknown emails so login timing doesn't reveal which accounts exist
+DUMMY_HASH = hash_password('dummy-password')
+
+def password_needs_rehash(password_hash):
+    if not password_hash.startswith('$argon2'):
+        return True
+    return ph.check_needs_rehash(password_hash)
+
+# Roles that can be given to users created through the API (owners are created with the account)
+ASSIGNABLE_ROLES = frozenset({'admin', 'analyst', 'content_creator'})
+
+USER_CACHE_TTL = 300  # Bounds how long a deactivated user stays logged in
+USERS_CACHE_TTL = 60
+ACCOUNT_CACHE_TTL = 300
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    # Serve the fields needed for auth checks from Redis, falling back to the DB
+    cached = cache.get(f'user:{user_id}')
+    if cached:
+        return User(**cached)
+    
+    user = User.query.get(int(user_id))
+    if user:
+        cache.set(f'user:{user_id}', {
+            'id': user.id,
+            'account_id': user.account_id,
+            'role': user.role,
+            'is_active': user.is_active
+        }, ttl=USER_CACHE_TTL)
+    return user
+
+# Audit logs are queued and written in batches by a background thread, keeping the
+# commit off the request path. Logs still queued when the process crashes are lost,
+# as are batches that keep failing after AUDIT_WRITE_ATTEMPTS tries.
+AUDIT_QUEUE_SIZE = 10_000
+AUDIT_BATCH_SIZE = 200
+AUDIT_FLUSH_INTERVAL = 0.05  # seconds
+AUDIT_EXIT_TIMEOUT = 5  # seconds to wait for queued logs at interpreter exit
+AUDIT_WRITE_ATTEMPTS = 3
+AUDIT_RETRY_DELAY = 0.5  # seconds, multiplied by the attempt number
+AUDIT_STOP = object()  # queue sentinel telling the writer to exit
+
+AUDIT_QUEUE = queue.Queue(maxsize=AUDIT_QUEUE_SIZE)
+audit_writer = None
+audit_writer_lock = threading.Lock()
+
+def reset_audit_writer():
+    """Forked children get a fresh queue and no writer; one is started on first use"""
+    global AUDIT_QUEUE, audit_writer, audit_writer_lock
+    AUDIT_QUEUE = queue.Queue(maxsize=AUDIT_QUEUE_SIZE)
+    audit_writer = None
+    audit_writer_lock = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=reset_audit_writer)
+
+def ensure_audit_writer():
+    """Start the writer thread for this process if it isn't running"""
+    global audit_writer
+    if audit_writer is not None and audit_writer.is_alive():
+        return
+    with audit_writer_lock:
+        if audit_writer is None or not audit_writer.is_alive():
+            audit_writer = threading.Thread(target=audit_log_writer, args=(AUDIT_QUEUE,),
+                                            name='audit-log-writer', daemon=True)
+            audit_writer.start()
 
 def log_audit_action(action, resource_type, resource_id=None, details=None):
-    """Helper function to log audit actions"""
+    """Helper function to log audit actions
+
+    The log is queued for the background writer and committed separately, so
+    call this only after the audited change has been committed. If the queue
+    is full the log is added to the session and committed at request teardown.
+
+    Queued logs are lost if the process crashes before they are written, or if
+    their batch still fails (e.g. SQLITE_BUSY) after AUDIT_WRITE_ATTEMPTS tries.
+    """
     if current_user.is_authenticated:
-        audit_log = AuditLog(
-            user_id=current_user.id,
-            account_id=current_user.account_id,
-            action=action,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            details=details,
-            ip_address=request.remote_addr,
-            user_agent=request.headers.get('User-Agent')
-        )
-        db.session.add(audit_log)
+        row = {
+            'user_id': current_user.id,
+            'account_id': current_user.account_id,
+            'action': action,
+            'resource_type': resource_type,
+            'resource_id': resource_id,
+            'details': details,
+            'ip_address': request.remote_addr,
+            'user_agent': request.headers.get('User-Agent'),
+            'created_at': datetime.utcnow()
+        }
+        ensure_audit_writer()
+        try:
+            AUDIT_QUEUE.put_nowait(row)
+        except queue.Full:
+            db.session.add(AuditLog(**row))
+
+def write_audit_logs(rows):
+    with app.app_context():
+        # insert(AuditLog) (not the bare table's insert) so the session routes it to the audit bind
+        db.session.execute(insert(AuditLog), rows)
+        db.session.commit()
+
+def write_audit_batch(batch):
+    """Write a batch, retrying transient failures such as a locked database"""
+    for attempt in range(1, AUDIT_WRITE_ATTEMPTS + 1):
+        try:
+            write_audit_logs(batch)
+            return
+        except Exception:
+            if attempt == AUDIT_WRITE_ATTEMPTS:
+                app.logger.exception('Dropping %d audit logs after %d failed attempts', len(batch), attempt)
+                return
+            app.logger.warning('Writing %d audit logs failed (attempt %d), retrying', len(batch), attempt)
+            time.sleep(AUDIT_RETRY_DELAY * attempt)
+
+def audit_log_writer(audit_queue):
+    """Drain the audit queue, inserting up to AUDIT_BATCH_SIZE logs per commit
+
+    Besides log rows the queue carries flush markers (threading.Event, set once
+    every earlier row is written) and AUDIT_STOP, which ends the thread.
+    """
+    while True:
+        batch, markers, stop = [], [], False
+        item = audit_queue.get()
+        deadline = time.monotonic() + AUDIT_FLUSH_INTERVAL
+        while True:
+            if item is AUDIT_STOP:
+                stop = True
+                break
+            if isinstance(item, threading.Event):
+                markers.append(item)
+                break
+            batch.append(item)
+            timeout = deadline - time.monotonic()
+            if len(batch) >= AUDIT_BATCH_SIZE or timeout <= 0:
+                break
+            try:
+                item = audit_queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+        if batch:
+            write_audit_batch(batch)
+        for marker in markers:
+            marker.set()
+        if stop:
+            return
+
+def flush_audit_logs(timeout=None):
+    """Wait until every audit log queued so far has been written
+
+    Returns False if the writer didn't catch up within the timeout.
+    """
+    if audit_writer is None or not audit_writer.is_alive():
+        return True
+    marker = threading.Event()
+    try:
+        AUDIT_QUEUE.put(marker, timeout=timeout)
+    except queue.Full:
+        return False
+    return marker.wait(timeout)
+
+def stop_audit_writer(timeout=AUDIT_EXIT_TIMEOUT):
+    """Write out queued logs and stop the writer, giving up after the timeout"""
+    if audit_writer is None or not audit_writer.is_alive():
+        return
+    try:
+        AUDIT_QUEUE.put(AUDIT_STOP, timeout=timeout)
+    except queue.Full:
+        return
+    audit_writer.join(timeout)
+
+atexit.register(stop_audit_writer)
+
+@app.teardown_request
+def commit_pending_changes(exception=None):
+    """Fallback commit for audit logs that overflowed the queue into the session"""
+    if exception is None and (db.session.new or db.session.dirty or db.session.deleted):
         db.session.commit()
 
+def require_roles(*roles):
+    """Require a logged-in user with one of the given roles"""
+    roles = frozenset(roles)
+    
+    def decorator(f):
+        @wraps(f)
+        @login_required
+        def wrapper(*args, **kwargs):
+            if current_user.role not in roles:
+                return jsonify({'error': 'Insufficient permissions'}), 403
+            return f(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def parse_iso_datetime(value):
+    """Parse an ISO 8601 query argument into a naive UTC datetime (None if missing)
+
+    Raises ValueError on malformed input.
+    """
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
 # Routes
 @app.route('/')
 def index():
@@ -89,11 +366,8 @@ def index():
     })
 
 @app.route('/audit-logs')
-@login_required
+@require_roles('owner', 'admin')
 def audit_logs_page():
-    # Only owners and admins can view audit logs
-    if current_user.role not in ['owner', 'admin']:
-        return jsonify({'error': 'Insufficient permissions'}), 403
     return render_template('audit_logs.html')
 
 @app.route('/api/accounts', methods=['POST'])
@@ -111,6 +385,9 @@ def create_account():
     if User.query.filter_by(email=data['owner_email']).first():
         return jsonify({'error': 'User with this email already exists'}), 409
     
+    # Hash before the first write so the SQLite write lock isn't held during hashing
+    password_hash = hash_password(data['owner_password'])
+    
     # Create account
     account = Account(name=data['name'], domain=data['domain'])
     db.session.add(account)
@@ -119,7 +396,7 @@ def create_account():
     # Create owner user
     owner = User(
         email=data['owner_email'],
-        password_hash=generate_password_hash(data['owner_password']),
+        password_hash=password_hash,
         first_name=data['owner_first_name'],
         last_name=data['owner_last_name'],
         role='owner',
@@ -127,7 +404,6 @@ def create_account():
     )
     db.session.add(owner)
     db.session.commit()
-    
     log_audit_action('account_created', 'account', str(account.id), f'Account {account.name} created')
     
     return jsonify({
@@ -141,30 +417,28 @@ def create_account():
     }), 201
 
 @app.route('/api/users', methods=['POST'])
-@login_required
+@require_roles('owner', 'admin')
 def create_user():
-    # Only owners and admins can create users
-    if current_user.role not in ['owner', 'admin']:
-        return jsonify({'error': 'Insufficient permissions'}), 403
-    
     data = request.get_json()
     
     if not data or not all(k in data for k in ['email', 'password', 'first_name', 'last_name', 'role']):
         return jsonify({'error': 'Missing required fields'}), 400
     
     # Validate role
-    valid_roles = ['admin', 'analyst', 'content_creator']
-    if data['role'] not in valid_roles:
+    if data['role'] not in ASSIGNABLE_ROLES:
         return jsonify({'error': 'Invalid role'}), 400
     
     # Check if user email already exists
     if User.query.filter_by(email=data['email']).first():
         return jsonify({'error': 'User with this email already exists'}), 409
     
+    # Hash before the first write so the SQLite write lock isn't held during hashing
+    password_hash = hash_password(data['password'])
+    
     # Create user
     user = User(
         email=data['email'],
-        password_hash=generate_password_hash(data['password']),
+        password_hash=password_hash,
         first_name=data['first_name'],
         last_name=data['last_name'],
         role=data['role'],
@@ -172,8 +446,8 @@ def create_user():
     )
     db.session.add(user)
     db.session.commit()
-    
     log_audit_action('user_created', 'user', str(user.id), f'User {user.email} created with role {user.role}')
+    cache.delete(f'users:acct:{current_user.account_id}')
     
     return jsonify({
         'message': 'User created successfully',
@@ -194,8 +468,13 @@ def login():
         return jsonify({'error': 'Email and password required'}), 400
     
     user = User.query.filter_by(email=data['email']).first()
+    password_ok = verify_password(user.password_hash if user else DUMMY_HASH, data['password'])
     
-    if user and check_password_hash(user.password_hash, data['password']) and user.is_active:
+    if user and password_ok and user.is_active:
+        # Transparently upgrade legacy or outdated hashes
+        if password_needs_rehash(user.password_hash):
+            user.password_hash = hash_password(data['password'])
+            db.session.commit()
         login_user(user)
         log_audit_action('user_login', 'user', str(user.id), 'User logged in successfully')
         return jsonify({
@@ -220,96 +499,120 @@ def logout():
     return jsonify({'message': 'Logout successful'})
 
 @app.route('/api/audit-logs', methods=['GET'])
-@login_required
+@require_roles('owner', 'admin')
 def get_audit_logs():
-    # Only owners and admins can view audit logs
-    if current_user.role not in ['owner', 'admin']:
-        return jsonify({'error': 'Insufficient permissions'}), 403
-    
-    # Get query parameters for filtering
-    page = request.args.get('page', 1, type=int)
+    # Get query parameters for filtering and the keyset cursor (last log of the previous page)
     per_page = min(request.args.get('per_page', 50, type=int), 100)
     user_id = request.args.get('user_id', type=int)
     action = request.args.get('action')
     resource_type = request.args.get('resource_type')
-    start_date = request.args.get('start_date')
-    end_date = request.args.get('end_date')
+    before_id = request.args.get('before_id', type=int)
+    try:
+        start_date = parse_iso_datetime(request.args.get('start_date'))
+        end_date = parse_iso_datetime(request.args.get('end_date'))
+        before = parse_iso_datetime(request.args.get('before'))
+    except ValueError:
+        return jsonify({'error': 'Invalid date format, expected ISO 8601'}), 400
+    if (before is None) != (before_id is None):
+        return jsonify({'error': 'before and before_id must be provided together'}), 400
     
-    # Build query
-    query = AuditLog.query.filter_by(account_id=current_user.account_id)
+    # Build query selecting plain columns, skipping ORM object hydration
+    stmt = select(
+        AuditLog.id,
+        AuditLog.action,
+        AuditLog.resource_type,
+        AuditLog.resource_id,
+        AuditLog.details,
+        AuditLog.ip_address,
+        AuditLog.user_agent,
+        AuditLog.created_at,
+        AuditLog.user_id
+    ).where(AuditLog.account_id == current_user.account_id)
     
     if user_id:
-        query = query.filter_by(user_id=user_id)
+        stmt = stmt.where(AuditLog.user_id == user_id)
     if action:
-        query = query.filter(AuditLog.action.contains(action))
+        # Prefix match expressed as a range so it can use the action index;
+        # LIKE '%x%' (and SQLite's case-insensitive LIKE 'x%') always scans
+        stmt = stmt.where(AuditLog.action >= action, AuditLog.action < action + '\uffff')
     if resource_type:
-        query = query.filter_by(resource_type=resource_type)
+        stmt = stmt.where(AuditLog.resource_type == resource_type)
     if start_date:
-        query = query.filter(AuditLog.created_at >= start_date)
+        stmt = stmt.where(AuditLog.created_at >= start_date)
     if end_date:
-        query = query.filter(AuditLog.created_at <= end_date)
+        stmt = stmt.where(AuditLog.created_at <= end_date)
     
-    # Order by created_at descending
-    query = query.order_by(AuditLog.created_at.desc())
+    if before is not None:
+        stmt = stmt.where(or_(
+            AuditLog.created_at < before,
+            and_(AuditLog.created_at == before, AuditLog.id < before_id)
+        ))
     
-    # Paginate results
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
-    audit_logs = pagination.items
+    # Order by created_at descending, id breaks ties so the cursor is stable
+    stmt = stmt.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
     
-    # Format response
-    logs = []
-    for log in audit_logs:
-        logs.append({
-            'id': log.id,
-            'user': {
-                'id': log.user.id,
-                'email': log.user.email,
-                'first_name': log.user.first_name,
-                'last_name': log.user.last_name,
-                'role': log.user.role
-            },
-            'action': log.action,
-            'resource_type': log.resource_type,
-            'resource_id': log.resource_id,
-            'details': log.details,
-            'ip_address': log.ip_address,
-            'user_agent': log.user_agent,
-            'created_at': log.created_at.isoformat()
-        })
+    # Fetch one extra row to detect a next page without an expensive COUNT
+    rows = db.session.execute(stmt.limit(per_page + 1)).all()
+    has_next = len(rows) > per_page
+    rows = rows[:per_page]
+    
+    # Users are in the main database, so load the page's users in one query and merge
+    user_ids = {row.user_id for row in rows}
+    users = {}
+    if user_ids:
+        user_rows = db.session.execute(
+            select(User.id, User.email, User.first_name, User.last_name, User.role).where(User.id.in_(user_ids))
+        ).mappings()
+        users = {user['id']: dict(user) for user in user_rows}
+    
+    # Format response (without a foreign key the user may be missing, so keep the user shape)
+    logs = [{
+        'id': row.id,
+        'user': users.get(row.user_id) or {
+            'id': row.user_id,
+            'email': None,
+            'first_name': None,
+            'last_name': None,
+            'role': None
+        },
+        'action': row.action,
+        'resource_type': row.resource_type,
+        'resource_id': row.resource_id,
+        'details': row.details,
+        'ip_address': row.ip_address,
+        'user_agent': row.user_agent,
+        'created_at': row.created_at
+    } for row in rows]
+    
+    next_cursor = None
+    if has_next:
+        next_cursor = {'before': logs[-1]['created_at'], 'before_id': logs[-1]['id']}
     
     return jsonify({
         'audit_logs': logs,
         'pagination': {
-            'page': page,
             'per_page': per_page,
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'has_next': pagination.has_next,
-            'has_prev': pagination.has_prev
+            'has_next': has_next,
+            'next_cursor': next_cursor
         }
     })
 
 @app.route('/api/users', methods=['GET'])
-@login_required
+@require_roles('owner', 'admin')
 def get_users():
-    # Only owners and admins can view users
-    if current_user.role not in ['owner', 'admin']:
-        return jsonify({'error': 'Insufficient permissions'}), 403
+    cache_key = f'users:acct:{current_user.account_id}'
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return jsonify({'users': cached})
     
-    users = User.query.filter_by(account_id=current_user.account_id).all()
-    
-    user_list = []
-    for user in users:
-        user_list.append({
-            'id': user.id,
-            'email': user.email,
-            'first_name': user.first_name,
-            'last_name': user.last_name,
-            'role': user.role,
-            'is_active': user.is_active,
-            'created_at': user.created_at.isoformat()
-        })
+    # Plain column rows (no ORM hydration); orjson serializes created_at directly
+    users = db.session.execute(
+        select(User.id, User.email, User.first_name, User.last_name, User.role, User.is_active, User.created_at)
+        .where(User.account_id == current_user.account_id)
+    ).mappings()
+    user_list = [dict(user) for user in users]
     
+    cache.set(cache_key, user_list, ttl=USERS_CACHE_TTL)
     return jsonify({'users': user_list})
 
 @app.route('/api/accounts/<int:account_id>', methods=['GET'])
@@ -319,16 +622,19 @@ def get_account(account_id):
     if current_user.account_id != account_id:
         return jsonify({'error': 'Access denied'}), 403
     
-    account = Account.query.get_or_404(account_id)
-    
-    return jsonify({
-        'account': {
+    cache_key = f'acct:{account_id}'
+    account_data = cache.get(cache_key)
+    if account_data is None:
+        account = Account.query.get_or_404(account_id)
+        account_data = {
             'id': account.id,
             'name': account.name,
             'domain': account.domain,
-            'created_at': account.created_at.isoformat()
+            'created_at': account.created_at
         }
-    })
+        cache.set(cache_key, account_data, ttl=ACCOUNT_CACHE_TTL)
+    
+    return jsonify({'account': account_data})
 
 if __name__ == '__main__':
     with app.app_context():
@@ -0,0 +1,44 @@
+import os
+import redis
+import orjson
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class CacheManager:
+    """Small JSON cache on top of Redis.
+
+    Values are serialized with orjson (datetimes become UTC ISO strings, as in
+    API responses). Redis errors are treated as cache misses so the app keeps
+    serving from the database when the cache is unavailable.
+    """
+
+    def __init__(self, url=None, default_ttl=300, timeout=0.1):
+        # Short timeouts so an unreachable Redis is a fast cache miss rather than a hung request
+        self.client = redis.Redis.from_url(
+            url or os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+            socket_connect_timeout=timeout,
+            socket_timeout=timeout
+        )
+        self.default_ttl = default_ttl
+
+    def get(self, key):
+        try:
+            value = self.client.get(key)
+        except redis.RedisError:
+            return None
+        return orjson.loads(value) if value is not None else None
+
+    def set(self, key, value, ttl=None):
+        try:
+            self.client.set(key, orjson.dumps(value, option=orjson.OPT_NAIVE_UTC), ex=ttl or self.default_ttl)
+        except redis.RedisError:
+            pass
+
+    def delete(self, key):
+        try:
+            self.client.delete(key)
+        except redis.RedisError:
+            pass
+
+cache = CacheManager()
@@ -4,8 +4,8 @@ Database initialization script for the Ecommerce Audit Logs application.
 This script creates the database tables and optionally adds sample data.
 """
 
-from app import app, db, Account, User, AuditLog
-from werkzeug.security import generate_password_hash
+from app import app, db, Account, User, AuditLog, hash_password
+from sqlalchemy import insert, inspect, select, text
 from datetime import datetime, timedelta
 import random
 
@@ -16,6 +16,35 @@ def init_database():
         db.create_all()
         print("Database tables created successfully!")
 
+def migrate_audit_logs():
+    """Move audit logs left in the main database into the audit database
+
+    Older versions kept audit_log in the main database. Its rows are copied
+    into the audit bind and the old table is renamed to audit_log_migrated,
+    so running this again does nothing. Returns the number of rows copied.
+    """
+    with app.app_context():
+        main_engine = db.engine
+        audit_engine = db.engines['audit']
+        if main_engine.url == audit_engine.url or not inspect(main_engine).has_table('audit_log'):
+            return 0
+        
+        # Read through the model's table so column types (e.g. created_at) are converted
+        with main_engine.connect() as conn:
+            rows = [dict(row) for row in conn.execute(select(*AuditLog.__table__.c)).mappings()]
+        
+        if rows:
+            # Keep the original IDs unless new logs have already been written to the audit database
+            if db.session.execute(select(AuditLog.id).limit(1)).first() is not None:
+                for row in rows:
+                    del row['id']
+            db.session.execute(insert(AuditLog), rows)
+            db.session.commit()
+        
+        with main_engine.begin() as conn:
+            conn.execute(text('ALTER TABLE audit_log RENAME TO audit_log_migrated'))
+        return len(rows)
+
 def create_sample_data():
     """Create sample data for testing"""
     with app.app_context():
@@ -30,7 +59,7 @@ def create_sample_data():
         # Create owner user
         owner = User(
             email="owner@sample-store.com",
-            password_hash=generate_password_hash("owner123"),
+            password_hash=hash_password("owner123"),
             first_name="John",
             last_name="Owner",
             role="owner",
@@ -41,7 +70,7 @@ def create_sample_data():
         # Create admin user
         admin = User(
             email="admin@sample-store.com",
-            password_hash=generate_password_hash("admin123"),
+            password_hash=hash_password("admin123"),
             first_name="Jane",
             last_name="Admin",
             role="admin",
@@ -52,7 +81,7 @@ def create_sample_data():
         # Create analyst user
         analyst = User(
             email="analyst@sample-store.com",
-            password_hash=generate_password_hash("analyst123"),
+            password_hash=hash_password("analyst123"),
             first_name="Bob",
             last_name="Analyst",
             role="analyst",
@@ -63,7 +92,7 @@ def create_sample_data():
         # Create content creator user
         content_creator = User(
             email="creator@sample-store.com",
-            password_hash=generate_password_hash("creator123"),
+            password_hash=hash_password("creator123"),
             first_name="Alice",
             last_name="Creator",
             role="content_creator",
@@ -85,6 +114,7 @@ def create_sample_data():
         users = [owner, admin, analyst, content_creator]
         
         # Generate sample audit logs for the past 30 days
+        rows = []
         for i in range(100):
             user = random.choice(users)
             action = random.choice(actions)
@@ -101,19 +131,20 @@ def create_sample_data():
                 minutes=minutes_ago
             )
             
-            audit_log = AuditLog(
-                user_id=user.id,
-                account_id=account.id,
-                action=action,
-                resource_type=resource_type,
-                resource_id=str(random.randint(1, 1000)),
-                details=f"Sample {action} action performed by {user.first_name} {user.last_name}",
-                ip_address=f"192.168.1.{random.randint(1, 255)}",
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                created_at=timestamp
-            )
-            db.session.add(audit_log)
+            rows.append({
+                'user_id': user.id,
+                'account_id': account.id,
+                'action': action,
+                'resource_type': resource_type,
+                'resource_id': str(random.randint(1, 1000)),
+                'details': f"Sample {action} action performed by {user.first_name} {user.last_name}",
+                'ip_address': f"192.168.1.{random.randint(1, 255)}",
+                'user_agent': "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                'created_at': timestamp
+            })
         
+        # Single executemany INSERT, skipping ORM object creation and unit-of-work tracking
+        db.session.execute(insert(AuditLog), rows)
         db.session.commit()
         print("Sample data created successfully!")
         print(f"Created account: {account.name} (ID: {account.id})")
@@ -122,7 +153,7 @@ def create_sample_data():
         print(f"  - Admin: {admin.email} (password: admin123)")
         print(f"  - Analyst: {analyst.email} (password: analyst123)")
         print(f"  - Content Creator: {content_creator.email} (password: creator123)")
-        print(f"Created {100} sample audit logs")
+        print(f"Created {len(rows)} sample audit logs")
 
 if __name__ == "__main__":
     print("Initializing Ecommerce Audit Logs Database...")
@@ -130,6 +161,11 @@ if __name__ == "__main__":
     # Initialize database
     init_database()
     
+    # Move audit logs from the main database if upgrading from a single-database install
+    migrated = migrate_audit_logs()
+    if migrated:
+        print(f"Moved {migrated} audit logs into the audit database")
+    
     # Ask if user wants to create sample data
     response = input("\nDo you want to create sample data? (y/n): ").lower().strip()
     if response in ['y', 'yes']:
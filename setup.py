@@ -42,6 +42,10 @@ FLASK_DEBUG=1
 
 # Database Configuration
 DATABASE_URL=sqlite:///audit_logs.db
+AUDIT_DATABASE_URL=sqlite:///audit.db
+
+# Cache Configuration
+REDIS_URL=redis://localhost:6379/0
 
 # Security
 BCRYPT_LOG_ROUNDS=12
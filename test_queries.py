@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Query-count and cache tests for the Ecommerce Audit Logs API.
+These run against an in-memory database and an in-memory cache through the
+Flask test client, guarding the list endpoints against N+1 query regressions.
+"""
+
+import os
+
+os.environ['DATABASE_URL'] = 'sqlite://'
+os.environ['AUDIT_DATABASE_URL'] = 'sqlite://'
+
+import orjson
+from sqlalchemy import event
+import app as app_module
+from app import app, db, Account, User, AuditLog, hash_password, flush_audit_logs
+
+# load_user (main) + audit log page (audit) + the page's users (main)
+MAX_AUDIT_LOG_QUERIES = 3
+
+
+class QueryCounter:
+    """Count SQL statements emitted on the given engines while active"""
+
+    def __init__(self, engines):
+        self.engines = list(engines)
+        self.count = 0
+
+    def _callback(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self):
+        for engine in self.engines:
+            event.listen(engine, 'before_cursor_execute', self._callback)
+        return self
+
+    def __exit__(self, *exc):
+        for engine in self.engines:
+            event.remove(engine, 'before_cursor_execute', self._callback)
+
+
+class FakeCache:
+    """In-memory stand-in for cache.CacheManager so tests never touch a real Redis"""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        value = self.store.get(key)
+        return orjson.loads(value) if value is not None else None
+
+    def set(self, key, value, ttl=None):
+        self.store[key] = orjson.dumps(value, option=orjson.OPT_NAIVE_UTC)
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+
+fake_cache = FakeCache()
+app_module.cache = fake_cache
+
+
+def setup_data(num_users=5, logs_per_user=10):
+    """Create an account with several users, each owning some audit logs"""
+    fake_cache.store.clear()
+    db.drop_all()
+    db.create_all()
+
+    account = Account(name='Query Test Store', domain='query-test.com')
+    db.session.add(account)
+    db.session.flush()
+
+    users = []
+    for i in range(num_users):
+        user = User(
+            email=f'user{i}@query-test.com',
+            password_hash=hash_password('password123'),
+            first_name='Query',
+            last_name=f'User{i}',
+            role='owner' if i == 0 else 'admin',
+            account_id=account.id
+        )
+        db.session.add(user)
+        users.append(user)
+    db.session.flush()
+
+    for user in users:
+        for j in range(logs_per_user):
+            db.session.add(AuditLog(
+                user_id=user.id,
+                account_id=account.id,
+                action='product_updated',
+                resource_type='product',
+                resource_id=str(j)
+            ))
+    db.session.commit()
+    return users[0]
+
+
+def test_audit_logs_query_count():
+    """Listing audit logs must not issue one query per log row"""
+    with app.app_context():
+        owner = setup_data()
+        client = app.test_client()
+        response = client.post('/api/auth/login', json={'email': owner.email, 'password': 'password123'})
+        assert response.status_code == 200
+        flush_audit_logs()
+
+        # Audit logs and users are in separate databases, so count on every engine
+        with QueryCounter(db.engines.values()) as counter:
+            response = client.get('/api/audit-logs?per_page=50')
+
+        assert response.status_code == 200
+        assert len(response.get_json()['audit_logs']) == 50
+        assert counter.count <= MAX_AUDIT_LOG_QUERIES, f'{counter.count} queries issued'
+
+
+def test_audit_logs_keyset_pagination():
+    """Following next_cursor visits every log exactly once"""
+    with app.app_context():
+        owner = setup_data()
+        client = app.test_client()
+        client.post('/api/auth/login', json={'email': owner.email, 'password': 'password123'})
+        flush_audit_logs()
+
+        seen = []
+        params = {'per_page': 15}
+        while True:
+            data = client.get('/api/audit-logs', query_string=params).get_json()
+            seen.extend(log['id'] for log in data['audit_logs'])
+            cursor = data['pagination']['next_cursor']
+            if cursor is None:
+                break
+            params = {'per_page': 15, **cursor}
+
+        # setup_data adds 50 logs, plus the login audit log
+        assert len(seen) == len(set(seen)) == 51
+
+
+def test_cached_user_authorizes_and_user_list_is_invalidated():
+    """A user hydrated from the cache can create users, and that clears the cached user list"""
+    with app.app_context():
+        owner = setup_data()
+        owner_id, account_id = owner.id, owner.account_id
+        client = app.test_client()
+        client.post('/api/auth/login', json={'email': owner.email, 'password': 'password123'})
+
+        # Populates user:<id> (via load_user) and users:acct:<id>
+        assert client.get('/api/users').status_code == 200
+        assert fake_cache.get(f'user:{owner_id}') is not None
+        assert fake_cache.get(f'users:acct:{account_id}') is not None
+
+        # Both lookups are now served from the cache
+        with QueryCounter(db.engines.values()) as counter:
+            response = client.get('/api/users')
+        assert response.status_code == 200
+        assert counter.count == 0
+
+        response = client.post('/api/users', json={
+            'email': 'new-analyst@query-test.com',
+            'password': 'password123',
+            'first_name': 'New',
+            'last_name': 'Analyst',
+            'role': 'analyst'
+        })
+        assert response.status_code == 201
+        assert fake_cache.get(f'users:acct:{account_id}') is None
+
+        emails = [user['email'] for user in client.get('/api/users').get_json()['users']]
+        assert 'new-analyst@query-test.com' in emails
+        flush_audit_logs()
+
+
+if __name__ == '__main__':
+    test_audit_logs_query_count()
+    test_audit_logs_keyset_pagination()
+    test_cached_user_authorizes_and_user_list_is_invalidated()
+    print('Query count tests passed!')